@@ -4,13 +4,27 @@ from __future__ import annotations
 
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
+from .const import DOMAIN
 from .coordinator import (
+    GeoSphereAustriaEnsembleUpdateCoordinator,
     GeoSphereAustriaPredictionConfigEntry,
+    GeoSphereAustriaPredictionData,
     GeoSphereAustriaPredictionUpdateCoordinator,
 )
+from .services import async_setup_services
 
-_PLATFORMS: list[Platform] = [Platform.WEATHER]
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+_PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.WEATHER]
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the GeoSphere Austria Prediction services."""
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(
@@ -21,7 +35,14 @@ async def async_setup_entry(
     coordinator = GeoSphereAustriaPredictionUpdateCoordinator(hass, entry)
     await coordinator.async_config_entry_first_refresh()
 
-    entry.runtime_data = coordinator
+    # The ensemble sensors are an add-on, they become unavailable instead of
+    # blocking the setup of the weather entity.
+    ensemble_coordinator = GeoSphereAustriaEnsembleUpdateCoordinator(hass, entry)
+    await ensemble_coordinator.async_refresh()
+
+    entry.runtime_data = GeoSphereAustriaPredictionData(
+        forecast=coordinator, ensemble=ensemble_coordinator
+    )
 
     await hass.config_entries.async_forward_entry_setups(entry, _PLATFORMS)
 
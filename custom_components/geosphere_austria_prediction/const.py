@@ -20,6 +20,11 @@ DOMAIN = "geosphere_austria_prediction"
 LOGGER = logging.getLogger(__package__)
 SCAN_INTERVAL = timedelta(minutes=60)
 
+ENSEMBLE_MEMBERS = 17
+ENSEMBLE_PERCENTILES = (10, 50, 90)
+# Hourly precipitation in mm above which a member counts as "precipitation".
+PRECIPITATION_THRESHOLD = 0.1
+
 GSA_TO_HA_CONDITION_MAP = {
     1: ATTR_CONDITION_SUNNY,
     2: ATTR_CONDITION_SUNNY,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import UTC, datetime
 
 from homeassistant.config_entries import ConfigEntry
@@ -10,13 +11,39 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, LOGGER, SCAN_INTERVAL
-from .geosphere_austria import GeoSphereAustriaError, GeoSphereAustriaPrediction
-from .models import Forecast
+from .const import (
+    DOMAIN,
+    ENSEMBLE_PERCENTILES,
+    LOGGER,
+    PRECIPITATION_THRESHOLD,
+    SCAN_INTERVAL,
+)
+from .geosphere_austria import (
+    GeoSphereAustriaEnsemble,
+    GeoSphereAustriaError,
+    GeoSphereAustriaPrediction,
+)
+from .models import EnsembleStatistics, Forecast
+from .profiler import profiled
 
-type GeoSphereAustriaPredictionConfigEntry = ConfigEntry[
-    GeoSphereAustriaPredictionUpdateCoordinator
-]
+type GeoSphereAustriaPredictionConfigEntry = ConfigEntry[GeoSphereAustriaPredictionData]
+
+
+@dataclass
+class GeoSphereAustriaPredictionData:
+    """Runtime data of a GeoSphere Austria Prediction config entry."""
+
+    forecast: GeoSphereAustriaPredictionUpdateCoordinator
+    ensemble: GeoSphereAustriaEnsembleUpdateCoordinator
+
+
+def _zone_coordinates(
+    hass: HomeAssistant, config_entry: GeoSphereAustriaPredictionConfigEntry
+) -> tuple[float, float]:
+    """Return latitude and longitude of the configured zone."""
+    if (zone := hass.states.get(config_entry.data[CONF_ZONE])) is None:
+        raise UpdateFailed(f"Zone '{config_entry.data[CONF_ZONE]}' not found")
+    return zone.attributes[ATTR_LATITUDE], zone.attributes[ATTR_LONGITUDE]
 
 
 class GeoSphereAustriaPredictionUpdateCoordinator(DataUpdateCoordinator[Forecast]):
@@ -38,17 +65,58 @@ class GeoSphereAustriaPredictionUpdateCoordinator(DataUpdateCoordinator[Forecast
         session = async_get_clientsession(hass)
         self.geosphere_austria_prediction = GeoSphereAustriaPrediction(session=session)
 
+    @profiled
     async def _async_update_data(self) -> Forecast:
         """Fetch data from GeoSphere Austria API."""
-        if (zone := self.hass.states.get(self.config_entry.data[CONF_ZONE])) is None:
-            raise UpdateFailed(f"Zone '{self.config_entry.data[CONF_ZONE]}' not found")
+        latitude, longitude = _zone_coordinates(self.hass, self.config_entry)
 
         try:
-            latitude = zone.attributes[ATTR_LATITUDE]
-            longitude = zone.attributes[ATTR_LONGITUDE]
             start = datetime.now(tz=UTC)
             return await self.geosphere_austria_prediction.query_geosphere_austria(
                 latitude, longitude, start
             )
         except GeoSphereAustriaError as err:
             raise UpdateFailed("GeoSphere Austria API communication error") from err
+
+
+class GeoSphereAustriaEnsembleUpdateCoordinator(
+    DataUpdateCoordinator[EnsembleStatistics]
+):
+    """A GeoSphere Austria ensemble Data Update Coordinator.
+
+    Percentiles and probabilities are computed once per update, entities only
+    index into the cached result.
+    """
+
+    config_entry: GeoSphereAustriaPredictionConfigEntry
+
+    def __init__(
+        self, hass: HomeAssistant, config_entry: GeoSphereAustriaPredictionConfigEntry
+    ) -> None:
+        """Initialize the GeoSphere Austria ensemble coordinator."""
+        super().__init__(
+            hass,
+            LOGGER,
+            config_entry=config_entry,
+            name=f"{DOMAIN}_{config_entry.data[CONF_ZONE]}_ensemble",
+            update_interval=SCAN_INTERVAL,
+        )
+        session = async_get_clientsession(hass)
+        self.geosphere_austria_ensemble = GeoSphereAustriaEnsemble(session=session)
+
+    @profiled
+    async def _async_update_data(self) -> EnsembleStatistics:
+        """Fetch ensemble data from GeoSphere Austria API."""
+        latitude, longitude = _zone_coordinates(self.hass, self.config_entry)
+
+        try:
+            start = datetime.now(tz=UTC)
+            ensemble = await self.geosphere_austria_ensemble.query_ensemble(
+                latitude, longitude, start
+            )
+        except GeoSphereAustriaError as err:
+            raise UpdateFailed("GeoSphere Austria API communication error") from err
+
+        if ensemble is None:
+            raise UpdateFailed("GeoSphere Austria API returned no ensemble data")
+        return ensemble.statistics(ENSEMBLE_PERCENTILES, PRECIPITATION_THRESHOLD)
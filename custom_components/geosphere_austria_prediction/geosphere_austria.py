@@ -1,7 +1,7 @@
 """GeoSphere Austria Prediction API wrapper."""
 
 import asyncio
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import datetime
 import json
 import socket
@@ -9,33 +9,91 @@ import socket
 import aiohttp
 from aiohttp.client import ClientError, ClientResponseError, ClientSession
 
-from .const import LOGGER
-from .models import Forecast
+from .const import ENSEMBLE_MEMBERS, LOGGER
+from .models import EnsembleForecast, Forecast
+from .profiler import profiled
 
-nwp_api_url = (
-    "https://dataset.api.hub.geosphere.at/v1/timeseries/forecast/nwp-v1-1h-2500m"
+# Forecast fields and the parameters of the 2.5 km NWP dataset providing them.
+nwp_forecast_parameters = {
+    "global_radiation": "grad",
+    "minimum_temperature": "mnt2m",
+    "maximum_temperature": "mxt2m",
+    "rain_amount": "rain_acc",
+    "relative_humidity": "rh2m",
+    "precipitation_amount": "rr_acc",
+    "snow_amount": "snow_acc",
+    "snow_limit": "snowlmt",
+    "surface_pressure": "sp",
+    "sun_duration": "sundur_acc",
+    "symbol": "sy",
+    "temperature": "t2m",
+    "total_cloud_cover": "tcc",
+    "windspeed_eastward": "u10m",
+    "ugust": "ugust",
+    "windspeed_northward": "v10m",
+    "vgust": "vgust",
+}
+
+# The long range dataset only provides the basic surface parameters.
+long_range_forecast_parameters = {
+    "precipitation_amount": "rr_acc",
+    "surface_pressure": "sp",
+    "temperature": "t2m",
+    "total_cloud_cover": "tcc",
+    "windspeed_eastward": "u10m",
+    "windspeed_northward": "v10m",
+}
+
+# Forecast fields accumulated since the start of the model run.
+_ACCUMULATED_FIELDS = (
+    "precipitation_amount",
+    "rain_amount",
+    "snow_amount",
+    "sun_duration",
+)
+
+
+@dataclass(frozen=True)
+class ForecastSource:
+    """A GeoSphere Austria forecast dataset and how often to refetch it."""
+
+    name: str
+    url: str
+    # Forecast field names mapped to the parameter names of the dataset.
+    parameters: dict[str, str]
+    hours: int
+    refresh_interval: datetime.timedelta
+    # Whether a failed fetch is only retried after the refresh interval.
+    backoff_on_error: bool = False
+
+
+high_resolution_source = ForecastSource(
+    name="nwp-v1-1h-2500m",
+    url="https://dataset.api.hub.geosphere.at/v1/timeseries/forecast/nwp-v1-1h-2500m",
+    parameters=nwp_forecast_parameters,
+    hours=90,
+    refresh_interval=datetime.timedelta(minutes=30),
+)
+
+long_range_source = ForecastSource(
+    name="nwp-v1-3h-10km",
+    url="https://dataset.api.hub.geosphere.at/v1/timeseries/forecast/nwp-v1-3h-10km",
+    parameters=long_range_forecast_parameters,
+    hours=240,
+    refresh_interval=datetime.timedelta(hours=6),
+    backoff_on_error=True,
 )
 
-nwp_forecast_params = {
+ensemble_api_url = (
+    "https://dataset.api.hub.geosphere.at/v1/timeseries/forecast/ensemble-v1-1h-2500m"
+)
+
+ensemble_forecast_params = {
     "lat_lon": None,
     "parameters": [
-        "grad",
-        "mnt2m",
-        "mxt2m",
-        "rain_acc",
-        "rh2m",
-        "rr_acc",
-        "snow_acc",
-        "snowlmt",
-        "sp",
-        "sundur_acc",
-        "sy",
-        "t2m",
-        "tcc",
-        "u10m",
-        "ugust",
-        "v10m",
-        "vgust",
+        f"{parameter}_m{member:02d}"
+        for parameter in ("t2m", "rr_acc")
+        for member in range(ENSEMBLE_MEMBERS)
     ],
     "start": None,
     "end": None,
@@ -55,20 +113,30 @@ class GeoSphereAustriaPrediction:
 
     _close_session: bool = False
 
-    async def query_geosphere_austria(self, latitude, longitude, start) -> Forecast:
-        """Queries the API of GeoSphere Austria numerical weather prediction."""
-        nwp_forecast_params["lat_lon"] = f"{latitude},{longitude}"
-        nwp_forecast_params["start"] = str(start)
-        nwp_forecast_params["end"] = str(start + datetime.timedelta(hours=90))
+    # Last forecast per source name with its fetch time and location, None
+    # if the last fetch failed.
+    _cache: dict[str, tuple[datetime.datetime, str, Forecast | None]] = field(
+        default_factory=dict
+    )
+
+    def _open_session(self) -> None:
+        """Create a client session if none was given."""
         if self.session is None:
             self.session = aiohttp.client.ClientSession()
             self._close_session = True
 
+    async def _close(self) -> None:
+        """Close the client session if it was created by this class."""
+        if self._close_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+            self._close_session = False
+
+    async def _request_json(self, url: str, params: dict) -> dict | None:
+        """Request a dataset from the GeoSphere Austria API and return its JSON."""
         try:
             async with asyncio.timeout(delay=None):
-                response = await self.session.get(
-                    url=nwp_api_url, params=nwp_forecast_params
-                )
+                response = await self.session.get(url=url, params=params)
         except TimeoutError as exception:
             msg = "Timeout while requesting forecast from GeoSphere Austria"
             raise GeoSphereAustriaConnectionError(msg) from exception
@@ -76,60 +144,225 @@ class GeoSphereAustriaPrediction:
             msg = "Error occurred while communicating with GeoSphere Austria API"
             raise GeoSphereAustriaConnectionError(msg) from exception
 
-        if response.status in (200, 301):
-            json_contents = await response.json()
+        if response.status not in (200, 301):
+            response.close()
+            msg = f"GeoSphere Austria API returned status {response.status} for {url}"
+            raise GeoSphereAustriaError(msg)
 
-        if self._close_session:
-            await self.session.close()
+        json_contents = await response.json()
+        response.close()
+
+        return json_contents
+
+    async def _query_source(
+        self, source: ForecastSource, lat_lon: str, start: datetime.datetime
+    ) -> Forecast | None:
+        """Queries a single forecast dataset of GeoSphere Austria."""
+        params = {
+            "lat_lon": lat_lon,
+            "parameters": list(source.parameters.values()),
+            "start": str(start),
+            "end": str(start + datetime.timedelta(hours=source.hours)),
+            "output_format": "geojson",
+        }
+        json_contents = await self._request_json(source.url, params)
+
+        if json_contents:
+            predictions = json_contents["features"][0]["properties"]["parameters"]
+            timestamps = [
+                datetime.datetime.strptime(x, "%Y-%m-%dT%H:%M%z")
+                for x in json_contents["timestamps"]
+            ]
+
+            values = dict.fromkeys(Forecast.model_fields)
+            for name, parameter in source.parameters.items():
+                values[name] = _parameter(predictions, parameter)
+            values["timestamps"] = timestamps
+            return Forecast(**values)
+        return None
+
+    async def _cached_source(
+        self, source: ForecastSource, lat_lon: str, start: datetime.datetime
+    ) -> Forecast | None:
+        """Return the forecast of a source, refetching it when it is due.
+
+        A failed fetch of a source with backoff is not retried before its next
+        refresh, other sources are retried on the next call.
+        """
+        cached = self._cache.get(source.name)
+        if cached is not None and cached[1] == lat_lon:
+            fetched, _, forecast = cached
+            if start - fetched < source.refresh_interval:
+                if forecast is None:
+                    msg = f"GeoSphere Austria dataset {source.name} failed recently"
+                    raise GeoSphereAustriaError(msg)
+                return forecast
+
+        try:
+            forecast = await self._query_source(source, lat_lon, start)
+        except GeoSphereAustriaError:
+            if source.backoff_on_error:
+                self._cache[source.name] = (start, lat_lon, None)
+            raise
+        if forecast is not None:
+            self._cache[source.name] = (start, lat_lon, forecast)
+        return forecast
+
+    @profiled
+    async def query_geosphere_austria(self, latitude, longitude, start) -> Forecast:
+        """Queries the API of GeoSphere Austria numerical weather prediction.
+
+        The high resolution and the long range datasets are queried
+        concurrently and stitched into one timeline.
+        """
+        lat_lon = f"{latitude},{longitude}"
+        self._open_session()
+        try:
+            high_resolution, long_range = await asyncio.gather(
+                self._cached_source(high_resolution_source, lat_lon, start),
+                self._cached_source(long_range_source, lat_lon, start),
+                return_exceptions=True,
+            )
+        finally:
+            await self._close()
+
+        if isinstance(high_resolution, BaseException):
+            raise high_resolution
+        if isinstance(long_range, BaseException):
+            if not isinstance(long_range, GeoSphereAustriaError):
+                raise long_range
+            LOGGER.warning("Long range forecast unavailable: %s", long_range)
+            long_range = None
+        if high_resolution is None:
+            return None
+        return _stitch_forecasts(high_resolution, long_range)
+
+
+def _parameter(predictions: dict, parameter: str) -> list[float] | None:
+    """Return the data of a parameter or None if the dataset lacks it."""
+    if parameter not in predictions:
+        return None
+    return predictions[parameter]["data"]
+
+
+def _stitch_forecasts(primary: Forecast, secondary: Forecast | None) -> Forecast:
+    """Append the hours of secondary that lie beyond the end of primary.
+
+    The appended part keeps the time step of secondary, e.g. 3-hourly values
+    after the hourly ones. Accumulated values of secondary are offset to
+    continue from the last value of primary at its last timestamp, because
+    both sources accumulate from the start of their own model run.
+    """
+    if secondary is None or not primary.timestamps or not secondary.timestamps:
+        return primary
+
+    end = primary.timestamps[-1]
+    tail = [
+        index
+        for index, timestamp in enumerate(secondary.timestamps)
+        if timestamp > end
+    ]
+    if not tail:
+        return primary
+
+    stitched = {
+        "timestamps": primary.timestamps
+        + [secondary.timestamps[index] for index in tail]
+    }
+    for name in Forecast.model_fields:
+        if name == "timestamps":
+            continue
+        head = getattr(primary, name)
+        rest = getattr(secondary, name)
+        if head is None and rest is None:
+            stitched[name] = None
+            continue
+        if head is None:
+            head = [None] * len(primary.timestamps)
+        if rest is None:
+            stitched[name] = head + [None] * len(tail)
+        elif name in _ACCUMULATED_FIELDS:
+            stitched[name] = head + _continue_accumulation(
+                head[-1], end, secondary.timestamps, rest, tail
+            )
+        else:
+            stitched[name] = head + [rest[index] for index in tail]
+    return Forecast(**stitched)
+
+
+def _continue_accumulation(
+    last: float | None,
+    end: datetime.datetime,
+    timestamps: list[datetime.datetime],
+    values: list[float | None],
+    tail: list[int],
+) -> list[float | None]:
+    """Offset accumulated values so that they continue from last at end."""
+    before = tail[0] - 1
+    after = tail[0]
+    if last is None or before < 0 or None in (values[before], values[after]):
+        return [None] * len(tail)
+
+    # Accumulation of values at end, interpolated between its neighbours.
+    fraction = (end - timestamps[before]) / (timestamps[after] - timestamps[before])
+    at_end = values[before] + fraction * (values[after] - values[before])
+    offset = last - at_end
+    return [
+        None if values[index] is None else values[index] + offset for index in tail
+    ]
+
+
+@dataclass
+class GeoSphereAustriaEnsemble(GeoSphereAustriaPrediction):
+    """Access the GeoSphere Austria ensemble weather prediction API."""
+
+    async def query_ensemble(self, latitude, longitude, start) -> EnsembleForecast:
+        """Queries the API of GeoSphere Austria ensemble weather prediction.
+
+        The query starts one hour before the current hour, the accumulated
+        precipitation of that hour is the base of the current hour's amount.
+        """
+        base = start.replace(minute=0, second=0, microsecond=0) - datetime.timedelta(
+            hours=1
+        )
+        params = {
+            **ensemble_forecast_params,
+            "lat_lon": f"{latitude},{longitude}",
+            "start": str(base),
+            "end": str(start + datetime.timedelta(hours=90)),
+        }
+        self._open_session()
+        try:
+            json_contents = await self._request_json(ensemble_api_url, params)
+        finally:
+            await self._close()
 
         if json_contents:
-            response.close()
             predictions = json_contents["features"][0]["properties"]["parameters"]
             timestamps = [
                 datetime.datetime.strptime(x, "%Y-%m-%dT%H:%M%z")
                 for x in json_contents["timestamps"]
             ]
-            grad = predictions["grad"]["data"]
-            mnt2m = predictions["mnt2m"]["data"]
-            mxt2m = predictions["mxt2m"]["data"]
-            rain_acc = predictions["rain_acc"]["data"]
-            rh2m = predictions["rh2m"]["data"]
-            rr_acc = predictions["rr_acc"]["data"]
-            snow_acc = predictions["snow_acc"]["data"]
-            snowlmt = predictions["snowlmt"]["data"]
-            sp = predictions["sp"]["data"]
-            sundur_acc = predictions["sundur_acc"]["data"]
-            sy = predictions["sy"]["data"]
-            t2m = predictions["t2m"]["data"]
-            tcc = predictions["tcc"]["data"]
-            u10m = predictions["u10m"]["data"]
-            ugust = predictions["ugust"]["data"]
-            v10m = predictions["v10m"]["data"]
-            vgust = predictions["vgust"]["data"]
-
-            return Forecast(
+            return EnsembleForecast(
                 timestamps=timestamps,
-                global_radiation=grad,
-                minimum_temperature=mnt2m,
-                maximum_temperature=mxt2m,
-                rain_amount=rain_acc,
-                relative_humidity=rh2m,
-                precipitation_amount=rr_acc,
-                snow_amount=snow_acc,
-                snow_limit=snowlmt,
-                surface_pressure=sp,
-                sun_duration=sundur_acc,
-                symbol=sy,
-                temperature=t2m,
-                total_cloud_cover=tcc,
-                windspeed_eastward=u10m,
-                windspeed_northward=v10m,
-                ugust=ugust,
-                vgust=vgust,
+                temperature=_ensemble_members(predictions, "t2m"),
+                precipitation_amount=_ensemble_members(predictions, "rr_acc"),
             )
         return None
 
 
+def _ensemble_members(
+    predictions: dict, parameter: str
+) -> list[list[float | None]] | None:
+    """Collect the members of an ensemble parameter into one member x hour block."""
+    members = [
+        predictions[f"{parameter}_m{member:02d}"]["data"]
+        for member in range(ENSEMBLE_MEMBERS)
+        if f"{parameter}_m{member:02d}" in predictions
+    ]
+    return members or None
+
+
 class GeoSphereAustriaError(Exception):
     """GeoSphere Austria exception."""
 
@@ -1,28 +1,96 @@
 """Data model for GeoSphere Austria Prediction."""
 
 from datetime import datetime
+import warnings
 
+import numpy as np
 from pydantic import BaseModel
 
 
 class Forecast(BaseModel):
-    """GeoSphere Austria Prediction data model."""
+    """GeoSphere Austria Prediction data model.
+
+    Values are None for hours a stitched source does not provide.
+    """
+
+    timestamps: list[datetime] | None
+    global_radiation: list[float | None] | None
+    minimum_temperature: list[float | None] | None
+    maximum_temperature: list[float | None] | None
+    rain_amount: list[float | None] | None
+    relative_humidity: list[float | None] | None
+    precipitation_amount: list[float | None] | None
+    snow_amount: list[float | None] | None
+    snow_limit: list[float | None] | None
+    surface_pressure: list[float | None] | None
+    sun_duration: list[float | None] | None
+    symbol: list[float | None] | None
+    temperature: list[float | None] | None
+    total_cloud_cover: list[float | None] | None
+    windspeed_eastward: list[float | None] | None
+    windspeed_northward: list[float | None] | None
+    ugust: list[float | None] | None
+    vgust: list[float | None] | None
+
+
+class EnsembleStatistics(BaseModel):
+    """Statistics derived from a GeoSphere Austria ensemble prediction."""
+
+    timestamps: list[datetime] | None
+    temperature_percentiles: dict[int, list[float | None]]
+    precipitation_probability: list[float | None] | None
+
+
+class EnsembleForecast(BaseModel):
+    """GeoSphere Austria ensemble prediction data model.
+
+    Every parameter is stored as one member x hour block, missing member
+    values are None.
+    """
 
     timestamps: list[datetime] | None
-    global_radiation: list[float] | None
-    minimum_temperature: list[float] | None
-    maximum_temperature: list[float] | None
-    rain_amount: list[float] | None
-    relative_humidity: list[float] | None
-    precipitation_amount: list[float] | None
-    snow_amount: list[float] | None
-    snow_limit: list[float] | None
-    surface_pressure: list[float] | None
-    sun_duration: list[float] | None
-    symbol: list[float] | None
-    temperature: list[float] | None
-    total_cloud_cover: list[float] | None
-    windspeed_eastward: list[float] | None
-    windspeed_northward: list[float] | None
-    ugust: list[float] | None
-    vgust: list[float] | None
+    temperature: list[list[float | None]] | None
+    precipitation_amount: list[list[float | None]] | None
+
+    def statistics(
+        self, percentiles: tuple[int, ...], precipitation_threshold: float
+    ) -> EnsembleStatistics:
+        """Compute percentiles and exceedance probabilities for all hours at once.
+
+        Precipitation is accumulated, so the first hour only serves as the base
+        of the hourly amounts and has no probability.
+        """
+        temperature_percentiles: dict[int, list[float | None]] = {}
+        if self.temperature:
+            with warnings.catch_warnings():
+                # Hours without any member value are reported as None.
+                warnings.simplefilter("ignore", RuntimeWarning)
+                values = np.nanpercentile(
+                    np.asarray(self.temperature, dtype=float), percentiles, axis=0
+                )
+            temperature_percentiles = {
+                percentile: _to_list(row.round(2))
+                for percentile, row in zip(percentiles, values, strict=True)
+            }
+
+        precipitation_probability: list[float | None] | None = None
+        if self.precipitation_amount:
+            hourly = np.diff(
+                np.asarray(self.precipitation_amount, dtype=float), axis=1
+            )
+            members = np.count_nonzero(~np.isnan(hourly), axis=0)
+            exceeded = np.count_nonzero(hourly > precipitation_threshold, axis=0)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                probability = exceeded / members * 100
+            precipitation_probability = [None, *_to_list(probability.round(1))]
+
+        return EnsembleStatistics(
+            timestamps=self.timestamps,
+            temperature_percentiles=temperature_percentiles,
+            precipitation_probability=precipitation_probability,
+        )
+
+
+def _to_list(values: np.ndarray) -> list[float | None]:
+    """Convert an array to a list with NaN replaced by None."""
+    return [None if np.isnan(value) else float(value) for value in values]
@@ -0,0 +1,127 @@
+"""Scoped cProfile capture for the hot paths of GeoSphere Austria Prediction."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Coroutine, Generator
+import cProfile
+import functools
+import inspect
+from typing import Any
+
+from .const import LOGGER
+
+
+class _Capture:
+    """Enables a profiler only while a profiled function is running."""
+
+    def __init__(self) -> None:
+        """Initialize an inactive capture."""
+        self.profile: cProfile.Profile | None = None
+        self._enabled: cProfile.Profile | None = None
+        self._depth = 0
+
+    def enter(self) -> bool:
+        """Enable the profiler on entering the outermost profiled function.
+
+        Returns False and stops the capture if the profiler cannot be enabled.
+        """
+        if self._depth == 0:
+            try:
+                self.profile.enable()
+            except ValueError as err:
+                # Another profiling tool is already active.
+                LOGGER.warning("Stopping GeoSphere Austria profile: %s", err)
+                self.profile = None
+                return False
+            self._enabled = self.profile
+        self._depth += 1
+        return True
+
+    def exit(self) -> None:
+        """Disable the profiler on leaving the outermost profiled function."""
+        self._depth -= 1
+        if self._depth == 0:
+            self._enabled.disable()
+            self._enabled = None
+
+
+_CAPTURE = _Capture()
+
+
+def is_active() -> bool:
+    """Return True if a profile is being captured."""
+    return _CAPTURE.profile is not None
+
+
+def start(profile: cProfile.Profile) -> None:
+    """Capture the profiled functions into the given profile."""
+    _CAPTURE.profile = profile
+
+
+def stop() -> bool:
+    """Stop capturing, calls already running finish unprofiled.
+
+    Returns False if the capture was already stopped because of an error.
+    """
+    running = _CAPTURE.profile is not None
+    _CAPTURE.profile = None
+    return running
+
+
+class _ProfiledCoroutine:
+    """Awaitable that profiles every step of a coroutine but not its waits."""
+
+    def __init__(self, coro: Coroutine[Any, Any, Any], capture: _Capture) -> None:
+        """Initialize the profiled coroutine."""
+        self._coro = coro
+        self._capture = capture
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        """Drive the coroutine, enabling the profiler around each step."""
+        coro = self._coro
+        message: Any = None
+        error: BaseException | None = None
+        while True:
+            profiling = self._capture.profile is not None and self._capture.enter()
+            try:
+                if error is None:
+                    yielded = coro.send(message)
+                else:
+                    yielded = coro.throw(error)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                if profiling:
+                    self._capture.exit()
+            error = None
+            try:
+                message = yield yielded
+            except BaseException as err:
+                error = err
+
+
+def profiled[**P, R](func: Callable[P, R]) -> Callable[P, R]:
+    """Profile a function while a capture is running.
+
+    Without a running capture the overhead is a single attribute lookup.
+    """
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+            if _CAPTURE.profile is None:
+                return await func(*args, **kwargs)
+            return await _ProfiledCoroutine(func(*args, **kwargs), _CAPTURE)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        if _CAPTURE.profile is None or not _CAPTURE.enter():
+            return func(*args, **kwargs)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _CAPTURE.exit()
+
+    return wrapper
@@ -0,0 +1,132 @@
+"""Support for GeoSphere Austria Prediction ensemble sensors."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import PERCENTAGE, UnitOfTemperature
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from homeassistant.helpers.event import async_track_utc_time_change
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, ENSEMBLE_PERCENTILES
+from .coordinator import (
+    GeoSphereAustriaEnsembleUpdateCoordinator,
+    GeoSphereAustriaPredictionConfigEntry,
+)
+from .models import EnsembleStatistics
+
+
+@dataclass(frozen=True, kw_only=True)
+class GeoSphereAustriaSensorEntityDescription(SensorEntityDescription):
+    """Describes a GeoSphere Austria ensemble sensor entity."""
+
+    value_fn: Callable[[EnsembleStatistics], list[float | None] | None]
+
+
+SENSORS: tuple[GeoSphereAustriaSensorEntityDescription, ...] = (
+    *(
+        GeoSphereAustriaSensorEntityDescription(
+            key=f"temperature_p{percentile}",
+            translation_key="temperature_percentile",
+            translation_placeholders={"percentile": str(percentile)},
+            device_class=SensorDeviceClass.TEMPERATURE,
+            state_class=SensorStateClass.MEASUREMENT,
+            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+            value_fn=lambda data, percentile=percentile: (
+                data.temperature_percentiles.get(percentile)
+            ),
+        )
+        for percentile in ENSEMBLE_PERCENTILES
+    ),
+    GeoSphereAustriaSensorEntityDescription(
+        key="precipitation_probability",
+        translation_key="precipitation_probability",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        value_fn=lambda data: data.precipitation_probability,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: GeoSphereAustriaPredictionConfigEntry,
+    async_add_entities: AddConfigEntryEntitiesCallback,
+) -> None:
+    """Set up GeoSphere Austria Prediction sensors based on config entry."""
+    coordinator = entry.runtime_data.ensemble
+    async_add_entities(
+        GeoSphereAustriaPredictionSensorEntity(
+            entry=entry, coordinator=coordinator, description=description
+        )
+        for description in SENSORS
+    )
+
+
+class GeoSphereAustriaPredictionSensorEntity(
+    CoordinatorEntity[GeoSphereAustriaEnsembleUpdateCoordinator], SensorEntity
+):
+    """Defines a GeoSphere Austria ensemble sensor entity."""
+
+    entity_description: GeoSphereAustriaSensorEntityDescription
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        *,
+        entry: GeoSphereAustriaPredictionConfigEntry,
+        coordinator: GeoSphereAustriaEnsembleUpdateCoordinator,
+        description: GeoSphereAustriaSensorEntityDescription,
+    ) -> None:
+        """Initialize GeoSphere Austria Prediction sensor entity."""
+        super().__init__(coordinator=coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+
+        self._attr_device_info = DeviceInfo(
+            entry_type=DeviceEntryType.SERVICE,
+            identifiers={(DOMAIN, entry.entry_id)},
+            manufacturer="GeoSphere Austria",
+            name=entry.title,
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Move to the next hour of the cached statistics on every full hour."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_utc_time_change(
+                self.hass, self._async_hour_changed, minute=0, second=0
+            )
+        )
+
+    @callback
+    def _async_hour_changed(self, now: datetime) -> None:
+        """Write the value of the new hour."""
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the value for the current hour."""
+        if not self.coordinator.data or not self.coordinator.data.timestamps:
+            return None
+        values = self.entity_description.value_fn(self.coordinator.data)
+        if not values:
+            return None
+
+        index = bisect_right(self.coordinator.data.timestamps, dt_util.utcnow()) - 1
+        if index < 0 or index >= len(values):
+            return None
+        return values[index]
@@ -0,0 +1,74 @@
+"""Services for the GeoSphere Austria Prediction integration."""
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import time
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+
+from . import profiler
+from .const import DOMAIN, LOGGER
+
+SERVICE_PROFILE = "profile"
+
+ATTR_DURATION = "duration"
+ATTR_FILENAME = "filename"
+
+SERVICE_PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=60.0): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=3600)
+        ),
+    }
+)
+
+
+async def _async_wait(duration: float) -> None:
+    """Wait while the profile is captured."""
+    await asyncio.sleep(duration)
+
+
+async def _async_profile(call: ServiceCall) -> ServiceResponse:
+    """Capture a profile of the integration's hot paths."""
+    hass = call.hass
+    if profiler.is_active():
+        raise HomeAssistantError("A GeoSphere Austria profile is already running")
+
+    profile = cProfile.Profile()
+    start_time = int(time.time() * 1000000)
+    profiler.start(profile)
+    try:
+        await _async_wait(call.data[ATTR_DURATION])
+    finally:
+        completed = profiler.stop()
+    if not completed:
+        raise HomeAssistantError(
+            "GeoSphere Austria profile stopped, another profiler is active"
+        )
+
+    filename = hass.config.path(f"{DOMAIN}.profile.{start_time}.cprof")
+    await hass.async_add_executor_job(profile.dump_stats, filename)
+    LOGGER.info("GeoSphere Austria profile written to %s", filename)
+    return {ATTR_FILENAME: filename}
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the GeoSphere Austria Prediction services."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        _async_profile,
+        schema=SERVICE_PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
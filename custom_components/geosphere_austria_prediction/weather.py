@@ -31,6 +31,7 @@ from homeassistant.util import dt as dt_util
 from .const import DOMAIN, GSA_TO_HA_CONDITION_MAP, LOGGER
 from .coordinator import GeoSphereAustriaPredictionConfigEntry
 from .models import Forecast as GeoSphereAustriaForecast
+from .profiler import profiled
 
 
 async def async_setup_entry(
@@ -39,12 +40,19 @@ async def async_setup_entry(
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up GeoSphere Austria Prediction weather entity based on config entry."""
-    coordinator = entry.runtime_data
+    coordinator = entry.runtime_data.forecast
     async_add_entities(
         [GeoSphereAustriaPredictionWeatherEntity(entry=entry, coordinator=coordinator)]
     )
 
 
+def _value_at(values: list[float | None] | None, index: int) -> float | None:
+    """Return the value of an hour or None if it is not available."""
+    if values is None:
+        return None
+    return values[index]
+
+
 class GeoSphereAustriaPredictionWeatherEntity(
     SingleCoordinatorWeatherEntity[DataUpdateCoordinator[GeoSphereAustriaForecast]]
 ):
@@ -117,6 +125,7 @@ class GeoSphereAustriaPredictionWeatherEntity(
     #     return self.coordinator.data.current_weather.wind_direction
 
     @callback
+    @profiled
     def _async_forecast_hourly(self) -> list[Forecast] | None:
         """Return the daily forecast in native units."""
 
@@ -138,32 +147,28 @@ class GeoSphereAustriaPredictionWeatherEntity(
                 datetime=_datetime.isoformat(),
             )
 
-            if hourly.temperature is not None:
-                forecast[ATTR_FORECAST_NATIVE_TEMP] = hourly.temperature[index]
-            if hourly.symbol is not None:
-                forecast[ATTR_FORECAST_CONDITION] = GSA_TO_HA_CONDITION_MAP.get(
-                    hourly.symbol[index]
-                )
-
-            if hourly.precipitation_amount is not None:
-                forecast[ATTR_FORECAST_NATIVE_PRECIPITATION] = (
-                    hourly.precipitation_amount[index]
-                )
-            if hourly.minimum_temperature is not None:
-                forecast[ATTR_FORECAST_NATIVE_TEMP_LOW] = hourly.minimum_temperature[
-                    index
-                ]
+            if (temperature := _value_at(hourly.temperature, index)) is not None:
+                forecast[ATTR_FORECAST_NATIVE_TEMP] = temperature
+            if (symbol := _value_at(hourly.symbol, index)) is not None:
+                forecast[ATTR_FORECAST_CONDITION] = GSA_TO_HA_CONDITION_MAP.get(symbol)
 
             if (
-                hourly.windspeed_eastward is not None
-                and hourly.windspeed_northward is not None
-            ):
+                precipitation := _value_at(hourly.precipitation_amount, index)
+            ) is not None:
+                forecast[ATTR_FORECAST_NATIVE_PRECIPITATION] = precipitation
+            if (
+                temperature_low := _value_at(hourly.minimum_temperature, index)
+            ) is not None:
+                forecast[ATTR_FORECAST_NATIVE_TEMP_LOW] = temperature_low
+
+            eastward = _value_at(hourly.windspeed_eastward, index)
+            northward = _value_at(hourly.windspeed_northward, index)
+            if eastward is not None and northward is not None:
                 forecast[ATTR_FORECAST_NATIVE_WIND_SPEED] = math.sqrt(
-                    math.pow(hourly.windspeed_eastward[index], 2)
-                    + math.pow(hourly.windspeed_northward[index], 2)
+                    math.pow(eastward, 2) + math.pow(northward, 2)
                 )
-            if hourly.surface_pressure is not None:
-                forecast[ATTR_FORECAST_PRESSURE] = hourly.surface_pressure[index] / 100
+            if (pressure := _value_at(hourly.surface_pressure, index)) is not None:
+                forecast[ATTR_FORECAST_PRESSURE] = pressure / 100
 
             forecasts.append(forecast)
 
@@ -13,7 +13,8 @@ from pytest_homeassistant_custom_component.syrupy import \
     HomeAssistantSnapshotExtension
 
 from custom_components.geosphere_austria_prediction.const import DOMAIN
-from custom_components.geosphere_austria_prediction.models import Forecast
+from custom_components.geosphere_austria_prediction.models import (
+    EnsembleForecast, Forecast)
 
 # from syrupy.assertion import SnapshotAssertion
 
@@ -68,3 +69,16 @@ def mock_geosphere_austria_prediction(
         geosphere_austria_prediction = geosphare_austria_prediction_mock.return_value
         geosphere_austria_prediction.query_geosphere_austria.return_value = forecast
         yield geosphere_austria_prediction
+
+
+@pytest.fixture
+def mock_geosphere_austria_ensemble() -> Generator[MagicMock]:
+    """Return a mocked GeoSphere Austria ensemble client."""
+    ensemble = EnsembleForecast.model_validate_json(load_fixture("ensemble.json"))
+    with patch(
+        "custom_components.geosphere_austria_prediction.coordinator.GeoSphereAustriaEnsemble",
+        autospec=True,
+    ) as geosphere_austria_ensemble_mock:
+        geosphere_austria_ensemble = geosphere_austria_ensemble_mock.return_value
+        geosphere_austria_ensemble.query_ensemble.return_value = ensemble
+        yield geosphere_austria_ensemble
@@ -0,0 +1,255 @@
+"""Tests for the GeoSphere Austria Prediction API wrapper."""
+
+from datetime import UTC, datetime, timedelta
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import load_fixture
+
+from custom_components.geosphere_austria_prediction.geosphere_austria import (
+    GeoSphereAustriaConnectionError, GeoSphereAustriaEnsemble,
+    GeoSphereAustriaPrediction, _stitch_forecasts, high_resolution_source,
+    long_range_source)
+from custom_components.geosphere_austria_prediction.models import Forecast
+
+
+def _long_range(forecast: Forecast) -> Forecast:
+    """Return a coarse forecast overlapping and extending the given forecast."""
+    timestamps = [
+        forecast.timestamps[0] + timedelta(hours=hours) for hours in range(0, 72, 6)
+    ]
+    values = {
+        name: [-1.0] * len(timestamps)
+        for name in Forecast.model_fields
+        if name not in ("timestamps", "snow_limit")
+    }
+    return Forecast(timestamps=timestamps, snow_limit=None, **values)
+
+
+async def test_query_stitches_long_range() -> None:
+    """Test the long range forecast extends the high resolution forecast."""
+    high_resolution = Forecast.model_validate_json(load_fixture("forecast.json"))
+    long_range = _long_range(high_resolution)
+    sources = {
+        high_resolution_source.name: high_resolution,
+        long_range_source.name: long_range,
+    }
+
+    async def query_source(source, lat_lon, start):
+        return sources[source.name]
+
+    client = GeoSphereAustriaPrediction(session=object())
+    with patch.object(client, "_query_source", side_effect=query_source):
+        forecast = await client.query_geosphere_austria(
+            48.2, 16.4, high_resolution.timestamps[0]
+        )
+
+    hours = len(high_resolution.timestamps)
+    tail = [t for t in long_range.timestamps if t > high_resolution.timestamps[-1]]
+    assert forecast.timestamps == high_resolution.timestamps + tail
+    assert forecast.temperature[:hours] == high_resolution.temperature
+    assert forecast.temperature[hours:] == [-1.0] * len(tail)
+    assert forecast.snow_limit[hours:] == [None] * len(tail)
+
+
+async def test_query_refreshes_sources_independently() -> None:
+    """Test the long range forecast is served from cache until it is due."""
+    high_resolution = Forecast.model_validate_json(load_fixture("forecast.json"))
+    long_range = _long_range(high_resolution)
+    queried = []
+
+    async def query_source(source, lat_lon, start):
+        queried.append(source.name)
+        if source is high_resolution_source:
+            return high_resolution
+        return long_range
+
+    client = GeoSphereAustriaPrediction(session=object())
+    start = datetime(2025, 9, 15, 15, tzinfo=UTC)
+    with patch.object(client, "_query_source", side_effect=query_source):
+        await client.query_geosphere_austria(48.2, 16.4, start)
+        await client.query_geosphere_austria(48.2, 16.4, start + timedelta(hours=1))
+        await client.query_geosphere_austria(48.2, 16.4, start + timedelta(hours=6))
+
+    assert queried.count(high_resolution_source.name) == 3
+    assert queried.count(long_range_source.name) == 2
+
+
+async def test_query_without_long_range() -> None:
+    """Test a failing long range source falls back to the high resolution forecast."""
+    high_resolution = Forecast.model_validate_json(load_fixture("forecast.json"))
+
+    async def query_source(source, lat_lon, start):
+        if source is long_range_source:
+            raise GeoSphereAustriaConnectionError
+        return high_resolution
+
+    client = GeoSphereAustriaPrediction(session=object())
+    with patch.object(client, "_query_source", side_effect=query_source):
+        forecast = await client.query_geosphere_austria(
+            48.2, 16.4, high_resolution.timestamps[0]
+        )
+
+    assert forecast == high_resolution
+
+
+async def test_query_ensemble() -> None:
+    """Test an ensemble response is parsed into member x hour blocks."""
+    response = MagicMock(status=200)
+    response.json = AsyncMock(
+        return_value=json.loads(load_fixture("ensemble_response.json"))
+    )
+    session = MagicMock()
+    session.get = AsyncMock(return_value=response)
+
+    client = GeoSphereAustriaEnsemble(session=session)
+    ensemble = await client.query_ensemble(
+        48.2, 16.4, datetime(2025, 9, 15, 15, 20, tzinfo=UTC)
+    )
+
+    params = session.get.call_args.kwargs["params"]
+    assert params["lat_lon"] == "48.2,16.4"
+    assert params["start"] == "2025-09-15 14:00:00+00:00"
+    assert ensemble.timestamps == [
+        datetime(2025, 9, 15, hour, tzinfo=UTC) for hour in (14, 15, 16)
+    ]
+    assert ensemble.temperature == [
+        [22.9, 24.1, 23.2],
+        [23.5, 24.7, None],
+        [22.4, 23.8, 22.9],
+    ]
+    assert ensemble.precipitation_amount == [
+        [0.0, 0.0, 0.0],
+        [0.1, 0.5, 0.9],
+        [0.0, 0.0, 0.3],
+    ]
+
+
+async def test_query_aligns_accumulated_values() -> None:
+    """Test accumulated values of the long range forecast continue seamlessly."""
+    high_resolution = Forecast.model_validate_json(load_fixture("forecast.json"))
+    long_range = _long_range(high_resolution)
+    long_range.precipitation_amount = [
+        100.0 + 2 * index for index in range(len(long_range.timestamps))
+    ]
+
+    async def query_source(source, lat_lon, start):
+        if source is high_resolution_source:
+            return high_resolution
+        return long_range
+
+    client = GeoSphereAustriaPrediction(session=object())
+    with patch.object(client, "_query_source", side_effect=query_source):
+        forecast = await client.query_geosphere_austria(
+            48.2, 16.4, high_resolution.timestamps[0]
+        )
+
+    hours = len(high_resolution.timestamps)
+    last = high_resolution.precipitation_amount[-1]
+    tail = forecast.precipitation_amount[hours:]
+    assert tail == pytest.approx([last + 2 * step for step in range(1, len(tail) + 1)])
+
+
+async def test_query_long_range_error_status(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a failing long range dataset is logged and not refetched every update."""
+    high_resolution = Forecast.model_validate_json(load_fixture("forecast.json"))
+    response = MagicMock(status=404)
+    session = MagicMock()
+    session.get = AsyncMock(return_value=response)
+
+    async def query_source(source, lat_lon, start):
+        if source is high_resolution_source:
+            return high_resolution
+        return await original_query_source(source, lat_lon, start)
+
+    client = GeoSphereAustriaPrediction(session=session)
+    original_query_source = client._query_source
+    start = datetime(2025, 9, 15, 15, tzinfo=UTC)
+    with patch.object(client, "_query_source", side_effect=query_source):
+        forecast = await client.query_geosphere_austria(48.2, 16.4, start)
+        await client.query_geosphere_austria(48.2, 16.4, start + timedelta(hours=1))
+
+    assert forecast == high_resolution
+    assert session.get.call_count == 1
+    assert "Long range forecast unavailable" in caplog.text
+    assert "status 404" in caplog.text
+
+
+def test_stitch_misaligned_seam() -> None:
+    """Test accumulations are aligned at the end of primary between two hours."""
+    start = datetime(2025, 9, 15, 0, tzinfo=UTC)
+
+    def forecast(hours: list[int]) -> Forecast:
+        values = dict.fromkeys(Forecast.model_fields)
+        values["timestamps"] = [start + timedelta(hours=hour) for hour in hours]
+        values["precipitation_amount"] = [float(hour) for hour in hours]
+        return Forecast(**values)
+
+    stitched = _stitch_forecasts(forecast([0, 1, 2, 3, 4]), forecast([0, 3, 6, 9, 12]))
+
+    assert stitched.precipitation_amount == pytest.approx(
+        [0.0, 1.0, 2.0, 3.0, 4.0, 6.0, 9.0, 12.0]
+    )
+
+
+async def test_query_source_parameters() -> None:
+    """Test a source is queried with its own parameters."""
+    response = MagicMock(status=200)
+    response.json = AsyncMock(
+        return_value={
+            "timestamps": ["2025-09-15T15:00+00:00"],
+            "features": [
+                {
+                    "properties": {
+                        "parameters": {
+                            parameter: {"data": [1.0]}
+                            for parameter in long_range_source.parameters.values()
+                        }
+                    }
+                }
+            ],
+        }
+    )
+    session = MagicMock()
+    session.get = AsyncMock(return_value=response)
+
+    client = GeoSphereAustriaPrediction(session=session)
+    forecast = await client._query_source(
+        long_range_source, "48.2,16.4", datetime(2025, 9, 15, 15, tzinfo=UTC)
+    )
+
+    assert session.get.call_args.kwargs["url"] == long_range_source.url
+    params = session.get.call_args.kwargs["params"]
+    assert params["parameters"] == list(long_range_source.parameters.values())
+    assert forecast.temperature == [1.0]
+    assert forecast.symbol is None
+
+
+async def test_query_retries_high_resolution() -> None:
+    """Test a failed high resolution fetch is retried on the next update."""
+    high_resolution = Forecast.model_validate_json(load_fixture("forecast.json"))
+    results = [GeoSphereAustriaConnectionError, high_resolution]
+    queried = []
+
+    async def query_source(source, lat_lon, start):
+        if source is long_range_source:
+            return None
+        queried.append(start)
+        if isinstance(result := results.pop(0), Forecast):
+            return result
+        raise result
+
+    client = GeoSphereAustriaPrediction(session=object())
+    start = datetime(2025, 9, 15, 15, tzinfo=UTC)
+    with patch.object(client, "_query_source", side_effect=query_source):
+        with pytest.raises(GeoSphereAustriaConnectionError):
+            await client.query_geosphere_austria(48.2, 16.4, start)
+        forecast = await client.query_geosphere_austria(
+            48.2, 16.4, start + timedelta(minutes=5)
+        )
+
+    assert len(queried) == 2
+    assert forecast == high_resolution
@@ -17,6 +17,7 @@ async def test_load_unload_config_entry(
     hass: HomeAssistant,
     mock_config_entry: MockConfigEntry,
     mock_geosphere_austria_prediction: AsyncMock,
+    mock_geosphere_austria_ensemble: AsyncMock,
 ) -> None:
     """Test the GeoSphere Austria Prediction configuration entry loading/unloading."""
     mock_config_entry.add_to_hass(hass)
@@ -0,0 +1,36 @@
+"""Tests for the GeoSphere Austria Prediction data models."""
+
+from pytest_homeassistant_custom_component.common import load_fixture
+
+from custom_components.geosphere_austria_prediction.models import \
+    EnsembleForecast
+
+
+def test_ensemble_statistics() -> None:
+    """Test percentiles and probabilities are computed per hour."""
+    ensemble = EnsembleForecast.model_validate_json(load_fixture("ensemble.json"))
+
+    statistics = ensemble.statistics((10, 50, 90), 0.1)
+
+    assert statistics.timestamps == ensemble.timestamps
+    assert statistics.temperature_percentiles == {
+        10: [23.92, 23.02, 21.88, 20.24],
+        50: [24.4, 23.6, 22.5, 20.9],
+        90: [24.88, 24.08, 23.06, 21.28],
+    }
+    # The first hour is the base of the accumulated precipitation.
+    assert statistics.precipitation_probability == [None, 20.0, 40.0, 40.0]
+
+
+def test_ensemble_statistics_missing_members() -> None:
+    """Test missing member values are ignored instead of failing."""
+    ensemble = EnsembleForecast(
+        timestamps=None,
+        temperature=[[1.0, None], [3.0, None]],
+        precipitation_amount=[[0.0, None, 1.0], [0.0, 0.5, None]],
+    )
+
+    statistics = ensemble.statistics((50,), 0.1)
+
+    assert statistics.temperature_percentiles == {50: [2.0, None]}
+    assert statistics.precipitation_probability == [None, 100.0, None]
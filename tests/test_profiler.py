@@ -0,0 +1,52 @@
+"""Tests for the GeoSphere Austria Prediction profiler."""
+
+import cProfile
+import pstats
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.geosphere_austria_prediction import profiler
+
+
+@profiler.profiled
+def _forecast() -> int:
+    """Return a value from a profiled function."""
+    return 42
+
+
+@profiler.profiled
+async def _update() -> int:
+    """Return a value from a profiled coroutine."""
+    return 42
+
+
+async def test_profiled_captures_calls() -> None:
+    """Test profiled functions are captured while a profile is running."""
+    profile = cProfile.Profile()
+    profiler.start(profile)
+    try:
+        assert _forecast() == 42
+        assert await _update() == 42
+    finally:
+        assert profiler.stop()
+
+    functions = {function for _, _, function in pstats.Stats(profile).stats}
+    assert {"_forecast", "_update"} <= functions
+
+
+async def test_profiled_other_profiler_active(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the wrapped calls still run when another profiler is active."""
+    profile = MagicMock()
+    profile.enable.side_effect = ValueError("Another profiling tool is already active")
+    profiler.start(profile)
+
+    assert _forecast() == 42
+    assert await _update() == 42
+
+    assert not profiler.is_active()
+    assert not profiler.stop()
+    assert "Another profiling tool is already active" in caplog.text
+    profile.disable.assert_not_called()
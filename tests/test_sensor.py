@@ -0,0 +1,106 @@
+"""Test for the GeoSphere Austria Prediction ensemble sensors."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import (MockConfigEntry,
+                                                          async_fire_time_changed)
+
+from custom_components.geosphere_austria_prediction.geosphere_austria import \
+    GeoSphereAustriaConnectionError
+
+
+@pytest.mark.freeze_time("2025-09-15T16:30:00Z")
+async def test_ensemble_sensors(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_geosphere_austria_prediction: AsyncMock,
+    mock_geosphere_austria_ensemble: AsyncMock,
+) -> None:
+    """Test the ensemble sensors report the statistics of the current hour."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert mock_geosphere_austria_ensemble.query_ensemble.call_count == 1
+
+    assert (state := hass.states.get("sensor.home_temperature_10th_percentile"))
+    assert state.state == "23.02"
+    assert (state := hass.states.get("sensor.home_temperature_50th_percentile"))
+    assert state.state == "23.6"
+    assert (state := hass.states.get("sensor.home_temperature_90th_percentile"))
+    assert state.state == "24.08"
+    assert (state := hass.states.get("sensor.home_precipitation_probability"))
+    assert state.state == "20.0"
+
+
+@pytest.mark.freeze_time("2025-09-15T15:10:00Z")
+async def test_ensemble_sensors_first_hour(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_geosphere_austria_prediction: AsyncMock,
+    mock_geosphere_austria_ensemble: AsyncMock,
+) -> None:
+    """Test the first hour has no precipitation probability instead of 0%."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert (state := hass.states.get("sensor.home_temperature_50th_percentile"))
+    assert state.state == "24.4"
+    assert (state := hass.states.get("sensor.home_precipitation_probability"))
+    assert state.state == STATE_UNKNOWN
+
+
+async def test_ensemble_unavailable(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_geosphere_austria_prediction: AsyncMock,
+    mock_geosphere_austria_ensemble: AsyncMock,
+) -> None:
+    """Test a failing ensemble does not prevent the weather entity from loading."""
+    mock_geosphere_austria_ensemble.query_ensemble.side_effect = (
+        GeoSphereAustriaConnectionError
+    )
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert mock_config_entry.state is ConfigEntryState.LOADED
+    assert (state := hass.states.get("weather.home"))
+    assert state.state != STATE_UNAVAILABLE
+    assert (state := hass.states.get("sensor.home_precipitation_probability"))
+    assert state.state == STATE_UNAVAILABLE
+
+
+@pytest.mark.freeze_time("2025-09-15T15:59:50Z")
+async def test_ensemble_sensors_next_hour(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    mock_config_entry: MockConfigEntry,
+    mock_geosphere_austria_prediction: AsyncMock,
+    mock_geosphere_austria_ensemble: AsyncMock,
+) -> None:
+    """Test the sensors move to the next hour without a coordinator update."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert (state := hass.states.get("sensor.home_precipitation_probability"))
+    assert state.state == STATE_UNKNOWN
+
+    next_hour = datetime(2025, 9, 15, 16, tzinfo=UTC)
+    freezer.move_to(next_hour)
+    async_fire_time_changed(hass, next_hour)
+    await hass.async_block_till_done()
+
+    assert mock_geosphere_austria_ensemble.query_ensemble.call_count == 1
+    assert (state := hass.states.get("sensor.home_precipitation_probability"))
+    assert state.state == "20.0"
+    assert (state := hass.states.get("sensor.home_temperature_50th_percentile"))
+    assert state.state == "23.6"
@@ -0,0 +1,66 @@
+"""Tests for the GeoSphere Austria Prediction services."""
+
+import pstats
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.geosphere_austria_prediction import profiler
+from custom_components.geosphere_austria_prediction.const import DOMAIN
+
+
+async def test_profile_service(
+    hass: HomeAssistant,
+    tmp_path,
+    mock_config_entry: MockConfigEntry,
+    mock_geosphere_austria_prediction: AsyncMock,
+    mock_geosphere_austria_ensemble: AsyncMock,
+) -> None:
+    """Test the profile service captures the coordinator update."""
+    hass.config.config_dir = str(tmp_path)
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    async def refresh_while_profiling(duration: float) -> None:
+        await mock_config_entry.runtime_data.forecast.async_refresh()
+
+    with patch(
+        "custom_components.geosphere_austria_prediction.services._async_wait",
+        side_effect=refresh_while_profiling,
+    ):
+        response = await hass.services.async_call(
+            DOMAIN,
+            "profile",
+            {"duration": 1},
+            blocking=True,
+            return_response=True,
+        )
+
+    assert not profiler.is_active()
+    assert response["filename"].startswith(str(tmp_path))
+    stats = pstats.Stats(response["filename"])
+    assert any(function == "_async_update_data" for _, _, function in stats.stats)
+
+
+async def test_profile_service_already_running(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_geosphere_austria_prediction: AsyncMock,
+    mock_geosphere_austria_ensemble: AsyncMock,
+) -> None:
+    """Test only one profile can be captured at a time."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    with (
+        patch.object(profiler, "is_active", return_value=True),
+        pytest.raises(HomeAssistantError),
+    ):
+        await hass.services.async_call(
+            DOMAIN, "profile", {"duration": 1}, blocking=True
+        )
@@ -16,6 +16,7 @@ async def test_forecast_service(
     hass: HomeAssistant,
     mock_config_entry: MockConfigEntry,
     mock_geosphere_austria_prediction: AsyncMock,
+    mock_geosphere_austria_ensemble: AsyncMock,
     snapshot: SnapshotAssertion,
 ) -> None:
     """Test forecast service."""